@@ -0,0 +1,85 @@
+"""
+On-disk cache for price history downloads
+
+Each (symbol, provider, day) is stored as parquet under ~/.cache/quant, so
+re-running a script on the same day reads from disk instead of the network.
+The date is part of the key, so entries expire at midnight. The cache is
+best-effort: a missing parquet engine or an unreadable/unwritable file only
+costs the speed-up, never the data. `fetch_many` fans a symbol list out over
+a thread pool (I/O-bound, so threads overlap the network latency).
+"""
+
+import hashlib
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path.home() / ".cache" / "quant"
+
+
+def _cache_path(*parts):
+    """Parquet path for today's entry keyed by `parts`"""
+    key = hashlib.sha1("|".join(map(str, (*parts, date.today()))).encode()).hexdigest()
+    return CACHE_DIR / f"{key}.parquet"
+
+
+def _read_cache(path):
+    """Cached frame at `path`, or None on a miss or any read error"""
+    try:
+        return pd.read_parquet(path) if path.exists() else None
+    except Exception:
+        return None
+
+
+def _write_cache(df, path):
+    """Store `df` at `path`; failures are ignored"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path)
+    except Exception:
+        pass
+
+
+def cached_history(symbol, provider="yfinance"):
+    """OpenBB price history for `symbol` (comma-separated for several), cached for the day"""
+    path = _cache_path(symbol, provider)
+    df = _read_cache(path)
+    if df is not None:
+        return df
+
+    from openbb import obb
+    df = obb.equity.price.historical(symbol=symbol, provider=provider).to_dataframe()
+    _write_cache(df, path)
+    return df
+
+
+def cached_download(symbols, period="1y", auto_adjust=False):
+    """yf.download for `symbols` in one batched call (column-grouped), cached for the day"""
+    symbols = list(symbols)
+    path = _cache_path(",".join(symbols), period, auto_adjust)
+    data = _read_cache(path)
+    if data is not None:
+        return data
+
+    import yfinance as yf
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        data = yf.download(symbols, period=period, auto_adjust=auto_adjust,
+                           group_by='column', threads=True, progress=False)
+    # Only cache complete downloads: a ticker that failed transiently (all-NaN
+    # column) would otherwise be served from disk for the rest of the day
+    if not data.empty and np.all(data['Close'].notna().any()):
+        _write_cache(data, path)
+    return data
+
+
+def fetch_many(symbols, provider="yfinance", threads=8):
+    """Cached price history for each symbol, fetched concurrently -> {symbol: DataFrame}"""
+    symbols = list(symbols)
+    with ThreadPoolExecutor(max_workers=max(1, min(threads, len(symbols)))) as executor:
+        frames = executor.map(lambda s: cached_history(s, provider), symbols)
+        return dict(zip(symbols, frames))
@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT
+
+`njit` / `vectorize` are numba.njit / numba.vectorize when Numba is installed.
+Otherwise `njit` is a no-op decorator and `vectorize` falls back to
+np.vectorize, so the same kernels run as plain Python (slower, but correct).
+
+    pip install numba
+"""
+
+import numpy as np
+
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    def vectorize(*args, **kwargs):
+        """Stand-in for numba.vectorize: np.vectorize over the scalar kernel (float64 output)"""
+        wrap = lambda fn: np.vectorize(fn, otypes=[np.float64])
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return wrap(args[0])
+        return wrap
@@ -0,0 +1,129 @@
+"""
+Compiled Black-Scholes kernels
+
+Closed-form European call prices. `bs_call` writes Φ via math.erf, so it
+needs neither scipy nor vollib and compiles under Numba (see _njit.py).
+`bs_call_f32` and `BSSlice` use scipy.special.ndtr, imported once on first use
+(`BSSlice` looks it up when the slice is built, not on every `price` call), so
+importing this module does not require scipy.
+`bs_call` is a NumPy ufunc: arrays (or scalars) broadcast, and Numba emits SIMD
+code spread over all cores (target='parallel'). For very large batches
+(N >= ~1e5) `bs_call_gpu` runs the same formula as a CuPy elementwise kernel.
+
+The float32 variants (`bs_call_f32`, `bs_call_gpu(..., dtype=np.float32)`)
+halve memory traffic on bandwidth-bound batches. Relative error is ~1e-7,
+which is fine for display-grade chains; pair them with an IV tolerance of
+~1e-5 rather than 1e-10.
+
+`BSSlice` prices a strike vector for one (S, t, r, sigma): everything that does
+not depend on K (ln S, (r + σ²/2)·t, σ√t, e^{-rt}) is computed once per slice.
+
+    from black_scholes import bs_call
+    prices = bs_call(S, K_array, t, r, sigma)
+
+    python scripts/black_scholes.py   # checks the pricers against each other
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from _njit import vectorize
+
+# CuPy is optional (pip install cupy-cuda12x); only bs_call_gpu needs it
+CUPY_AVAILABLE = False
+try:
+    import cupy as cp
+    _bs_call_kernel = cp.ElementwiseKernel(
+        'T S, T K, T t, T r, T sig',
+        'T out',
+        '''
+        T sqt = sqrt(t);
+        T d1 = (log(S / K) + (r + (T)0.5 * sig * sig) * t) / (sig * sqt);
+        T d2 = d1 - sig * sqt;
+        out = S * (T)0.5 * ((T)1 + erf(d1 / (T)M_SQRT2))
+            - K * exp(-r * t) * (T)0.5 * ((T)1 + erf(d2 / (T)M_SQRT2));
+        ''',
+        'bs_call',
+    )
+    CUPY_AVAILABLE = True
+except ImportError:
+    pass
+
+_SQRT2 = math.sqrt(2.0)
+
+
+@lru_cache(maxsize=None)
+def _ndtr():
+    """scipy.special.ndtr, imported on first use (scipy is only needed by the ndtr pricers)"""
+    from scipy.special import ndtr
+    return ndtr
+
+
+@vectorize(['float64(float64, float64, float64, float64, float64)'], target='parallel', fastmath=True, cache=True)
+def bs_call(S, K, t, r, sigma):
+    """Black-Scholes European call price (element-wise over broadcast arrays)"""
+    sqt = math.sqrt(t)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * t) / (sigma * sqt)
+    d2 = d1 - sigma * sqt
+    Nd1 = 0.5 * (1.0 + math.erf(d1 / _SQRT2))
+    Nd2 = 0.5 * (1.0 + math.erf(d2 / _SQRT2))
+    return S * Nd1 - K * math.exp(-r * t) * Nd2
+
+
+def bs_call_f32(S, K, t, r, sigma):
+    """Black-Scholes call prices computed entirely in float32"""
+    ndtr = _ndtr()
+    S, K, t, r, sigma = (np.asarray(x, dtype=np.float32) for x in (S, K, t, r, sigma))
+    sqt = np.sqrt(t)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * t) / (sigma * sqt)
+    d2 = d1 - sigma * sqt
+    return S * ndtr(d1) - K * np.exp(-r * t) * ndtr(d2)
+
+
+def bs_call_gpu(S, K, t, r, sigma, dtype=np.float64):
+    """bs_call on the GPU via CuPy: NumPy arrays in, NumPy array out (float64 or float32)"""
+    if not CUPY_AVAILABLE:
+        raise ImportError("CuPy is required for bs_call_gpu: pip install cupy-cuda12x")
+    args = (cp.asarray(np.asarray(x, dtype=dtype)) for x in (S, K, t, r, sigma))
+    return cp.asnumpy(_bs_call_kernel(*args))
+
+
+class BSSlice:
+    """Black-Scholes pricer for one expiry slice; only the strike varies between calls"""
+
+    def __init__(self, S, t, r, sigma):
+        self.S = S
+        self.logS = math.log(S)
+        self.mu_t = (r + 0.5 * sigma * sigma) * t
+        self.sig_sqt = sigma * math.sqrt(t)
+        self.df = math.exp(-r * t)
+        self._ndtr = _ndtr()
+
+    def price(self, K, flag='c'):
+        """Call ('c') or put ('p') prices for a strike or strike array"""
+        ndtr = self._ndtr
+        K = np.asarray(K, dtype=np.float64)
+        d1 = (self.logS - np.log(K) + self.mu_t) / self.sig_sqt
+        d2 = d1 - self.sig_sqt
+        call = self.S * ndtr(d1) - K * self.df * ndtr(d2)
+        return call if flag == 'c' else call - self.S + K * self.df  # put via put-call parity
+
+
+if __name__ == "__main__":
+    # Self-check: the math.erf ufunc, the per-slice ndtr pricer and the float32 path agree
+    S, t, r, sigma = 100.0, 30 / 365, 0.01, 0.2
+    K = np.array([95.0, 100.0, 105.0, 110.0])
+    ref = bs_call(S, K, t, r, sigma)
+    slice_ = BSSlice(S, t, r, sigma)
+    err = np.abs(slice_.price(K) - ref).max()
+    err_put = np.abs(slice_.price(K, 'p') - (ref - S + K * math.exp(-r * t))).max()
+    err_f32 = (np.abs(bs_call_f32(S, K, t, r, sigma) - ref) / ref).max()
+    print(f"BSSlice vs bs_call: max abs diff {err:.2e} (calls), {err_put:.2e} (puts vs parity)")
+    print(f"bs_call_f32 vs bs_call: max rel diff {err_f32:.2e}")
+    assert err < 1e-12 and err_put < 1e-12 and err_f32 < 1e-5
+    if CUPY_AVAILABLE:
+        err_gpu = np.abs(bs_call_gpu(S, K, t, r, sigma) - ref).max()
+        print(f"bs_call_gpu vs bs_call: max abs diff {err_gpu:.2e}")
+        assert err_gpu < 1e-12
@@ -0,0 +1,130 @@
+"""
+Implied volatility in Jäckel's normalized coordinates ("Let's Be Rational")
+
+The Black price is rewritten as the normalized call
+    b(x, s) = e^{x/2} Φ(x/s + s/2) - e^{-x/2} Φ(x/s - s/2)
+where x = ln(F/K) is log-moneyness and s = σ√t is total volatility. In-the-money
+options are reduced to out-of-the-money ones by put-call symmetry (x -> -|x|,
+intrinsic value removed). The solve then starts from the inflexion point
+s_c = √(2|x|) and uses Jäckel's region-dependent objectives:
+    lower branch (b < b(s_c)): 1/ln b(s) - 1/ln β   (close to linear in s)
+    upper branch:             ln(b_max - β) - ln(b_max - b(s)),  b_max = e^{x/2}
+A few third-order (Householder) steps run on the whole array. No option gets
+its own Python-level solver call.
+
+    from iv_rational import implied_volatility
+    iv = implied_volatility(price, S, K, t, r, flag)   # arrays or scalars
+"""
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def normalized_black_call(x, s):
+    """Normalized Black call b(x, s) (undiscounted, in units of √(F·K))"""
+    h, t = x / s, 0.5 * s
+    return np.exp(0.5 * x) * ndtr(h + t) - np.exp(-0.5 * x) * ndtr(h - t)
+
+
+def _normalized_vega(x, s):
+    """∂b/∂s and the ratios b''/b', b'''/b' used by the Householder step"""
+    vega = _INV_SQRT_2PI * np.exp(-0.5 * (x * x / (s * s) + 0.25 * s * s))
+    x2_s3 = x * x / (s * s * s)
+    r2 = x2_s3 - 0.25 * s
+    r3 = r2 * r2 - 3.0 * x2_s3 / s - 0.25
+    return vega, r2, r3
+
+
+def implied_total_vol(beta, x, max_iter=16, tol=1e-12):
+    """Total volatility s = σ√t from normalized OTM call prices beta at x <= 0
+
+    Steps stop once every update is below ~1e-14·s (or after `max_iter`). Entries
+    that then do not reprice β to within relative error `tol`, or whose price is
+    outside (0, e^{x/2}), come back as NaN rather than as a finite wrong vol.
+    """
+    beta, x = np.broadcast_arrays(np.asarray(beta, dtype=np.float64), np.asarray(x, dtype=np.float64))
+    b_max = np.exp(0.5 * x)
+    valid = (beta > 0) & (beta < b_max)
+    beta = np.where(valid, beta, 0.5 * b_max)
+
+    s_c = np.sqrt(2.0 * np.abs(x))
+    b_c = normalized_black_call(x, np.maximum(s_c, 1e-300))
+    lower = beta < b_c
+    ln_beta = np.log(beta)
+    # Initial guesses: on the lower branch interpolate 1/ln b (close to linear in s
+    # near s_c), but never start below the tail asymptote ln b ~ -x²/(2s²), where b
+    # would underflow; the upper start is exact at the money (b = 2Φ(s/2) - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s_lo = np.maximum(s_c * np.log(np.maximum(b_c, 1e-300)) / ln_beta,
+                          np.abs(x) / np.sqrt(-2.0 * ln_beta))
+    s_up = np.maximum(s_c, 2.0 * ndtri(0.5 * (1.0 + beta / b_max)))
+    s = np.maximum(np.where(lower, s_lo, s_up), 1e-8)
+
+    # Both branch objectives are evaluated everywhere; ignore the unused branch's overflow
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            b = normalized_black_call(x, s)
+            vega, r2, r3 = _normalized_vega(x, s)
+
+            # Lower branch: f = 1/ln b - 1/ln β
+            ln_b = np.log(np.maximum(b, 1e-300))
+            f_lo = 1.0 / ln_b - 1.0 / ln_beta
+            g = vega / b                            # (ln b)'
+            d1_lo = -g / (ln_b * ln_b)
+            # u''/u'·b' and u'''/u'·b'^2 for u = 1/ln b, written in g = b'/b so that
+            # deep OTM prices (b ~ 1e-180) do not overflow through 1/b²
+            u2 = -(1.0 + 2.0 / ln_b) * g
+            u3 = (2.0 + 6.0 / ln_b + 6.0 / (ln_b * ln_b)) * g * g
+
+            # Upper branch: f = ln(b_max - β) - ln(b_max - b)
+            gap = np.maximum(b_max - b, 1e-300)
+            f_up = np.log(b_max - beta) - np.log(gap)
+            d1_up = vega / gap
+            v2 = d1_up                              # same terms for u = -ln(b_max - b)
+            v3 = 2.0 * d1_up * d1_up
+
+            f = np.where(lower, f_lo, f_up)
+            d1 = np.where(lower, d1_lo, d1_up)
+            k2 = np.where(lower, u2, v2)
+            k3 = np.where(lower, u3, v3)
+            # Chain rule: f''/f' = k2 + b''/b', f'''/f' = k3 + 3·k2·b''/b' + b'''/b'
+            h2 = k2 + r2
+            h3 = k3 + 3.0 * k2 * r2 + r3
+
+            nu = -f / d1
+            step = nu * (1.0 + 0.5 * h2 * nu) / (1.0 + nu * (h2 + h3 * nu / 6.0))
+            # Fall back to the Newton step where the higher-order correction blows up
+            # or reverses its direction (far from the root, h2·ν and h3·ν² are not small)
+            step = np.where(np.isfinite(step) & (step * nu > 0), step, nu)
+            s = np.where(s + step > 0, s + step, 0.5 * s)
+            if not np.any(np.abs(step) > 1e-14 * s):
+                break
+
+        # Reprice once more. The error is measured against β + s·b' (so a vol right to
+        # `tol` is kept where b is steep in s) plus the rounding noise of b's two terms
+        vega = _normalized_vega(x, s)[0]
+        noise = 16.0 * np.finfo(np.float64).eps * b_max * ndtr(x / s + 0.5 * s)
+        converged = np.abs(normalized_black_call(x, s) - beta) <= tol * (beta + s * vega) + noise
+
+    return np.where(valid & converged, s, np.nan)
+
+
+def implied_volatility(price, S, K, t, r, flag, q=0.0):
+    """Black-Scholes implied volatility for scalars or arrays (flag: 'c'/'p')"""
+    price, S, K, t, r, q = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (price, S, K, t, r, q))
+    )
+    theta = np.where(np.broadcast_to(np.asarray(flag) == 'c', S.shape), 1.0, -1.0)
+
+    F = S * np.exp((r - q) * t)
+    beta = price / (np.exp(-r * t) * np.sqrt(F * K))
+    x = np.log(F / K)
+
+    # Reduce to an OTM call at x <= 0: drop intrinsic value, reflect x
+    intrinsic = np.maximum(theta * (np.exp(0.5 * x) - np.exp(-0.5 * x)), 0.0)
+    s = implied_total_vol(beta - intrinsic, -np.abs(x))
+
+    iv = s / np.sqrt(t)
+    return iv if iv.ndim else float(iv)
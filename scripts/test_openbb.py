@@ -1,28 +1,40 @@
+import numpy as np
 import pandas as pd
+from sma import sma_pair
+from _cache import fetch_many
+
+# Cap repr width: tail() printing is formatting-bound, not compute-bound
+pd.options.display.max_columns = 6
+
+def find_close_col(columns, priority=("close", "Close", "Adj Close")):
+	"""First close-price column present (top level for MultiIndex), else None"""
+	cols = set(columns.get_level_values(0))
+	return next((c for c in priority if c in cols), None)
 
 try:
-	from openbb import obb
-	
-	# Fetch data for multiple symbols (comma-separated)
-	symbols = "AAPL,MSFT,GOOGL"
-	print(f"Fetching data for: {symbols}")
+	# Fetch each symbol concurrently; reruns on the same day hit the disk cache
+	symbols = ["AAPL", "MSFT", "GOOGL"]
+	print(f"Fetching data for: {', '.join(symbols)}")
 	
-	result = obb.equity.price.historical(symbol=symbols)
-	df = result.to_dataframe()
+	frames = fetch_many(symbols, provider="yfinance")
 	
-	print(f"✓ Successfully fetched {len(df)} rows")
+	print(f"✓ Successfully fetched {sum(len(df) for df in frames.values())} rows")
 	
-	# Pivot to get symbols as columns (for portfolio analysis)
-	portfolio_prices = df.pivot_table(values='close', index='date', columns='symbol')
+	# Symbols as columns (for portfolio analysis)
+	portfolio_prices = pd.DataFrame({symbol: df[find_close_col(df.columns)] for symbol, df in frames.items()})
+	# float32 halves the footprint of the prices and the SMA outputs
+	portfolio_prices = portfolio_prices.astype(np.float32)
 	
 	print("\nLatest prices:")
 	print(portfolio_prices.tail())
 	
 	# Calculate moving averages for each stock
 	print("\nCalculating moving averages...")
-	for symbol in portfolio_prices.columns:
-		portfolio_prices[f'{symbol}_SMA20'] = portfolio_prices[symbol].rolling(20).mean()
-		portfolio_prices[f'{symbol}_SMA50'] = portfolio_prices[symbol].rolling(50).mean()
+	for symbol in list(portfolio_prices.columns):
+		close = portfolio_prices[symbol].dropna()
+		sma20, sma50 = sma_pair(close.to_numpy(), 20, 50)
+		portfolio_prices.loc[:, f'{symbol}_SMA20'] = pd.Series(sma20, index=close.index)
+		portfolio_prices.loc[:, f'{symbol}_SMA50'] = pd.Series(sma50, index=close.index)
 	
 	# Display results for each stock
 	for symbol in ['AAPL', 'MSFT', 'GOOGL']:
@@ -35,9 +47,7 @@ except Exception as e:
 	import yfinance as yf
 	df = yf.download(["AAPL", "MSFT", "GOOGL"], period="1y", auto_adjust=False, progress=False)
 	
-	if 'Close' in df.columns:
-		portfolio_prices = df['Close']
-	else:
-		portfolio_prices = df
+	close_col = find_close_col(df.columns)
+	portfolio_prices = df[close_col] if close_col else df
 	
 	print(portfolio_prices.tail())
@@ -1,6 +1,6 @@
-# pip install vollib
-from vollib.black_scholes import price as bs_price
-from vollib.black_scholes.implied_volatility import implied_volatility
+# pip install scipy  (pricing is stdlib math.erf; iv_rational only needs scipy.special, no vollib / scipy.stats)
+import math
+from iv_rational import implied_volatility
 
 S = 100.0     # spot
 K = 105.0     # strike
@@ -9,10 +9,18 @@ t = 30/365    # time to expiry in years
 sigma = 0.2   # vol
 flag = 'c'    # call
 
-bs = bs_price(flag, S, K, t, r, sigma)
+def _phi(x):
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+def bs_call(S, K, t, r, sigma):
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * t) / (sigma * math.sqrt(t))
+    d2 = d1 - sigma * math.sqrt(t)
+    return S * _phi(d1) - K * math.exp(-r * t) * _phi(d2)
+
+bs = bs_call(S, K, t, r, sigma)
 print("Black-Scholes price:", bs)
 
-# invert to find implied vol from market price
+# invert to find implied vol from market price (normalized coordinates, no iterative vollib solver)
 market_price = bs  # pretend market equals model
 iv = implied_volatility(market_price, S, K, t, r, flag)
-print("Implied vol:", iv)
\ No newline at end of file
+print("Implied vol:", iv)